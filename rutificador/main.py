@@ -1,11 +1,49 @@
 # pylint: disable=missing-module-docstring
 
 import re
-from typing import List, Dict, Tuple, Union
+from functools import lru_cache
+from itertools import chain
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 FACTORES_DIGITO_VERIFICADOR: List[int] = [2, 3, 4, 5, 6, 7]
 MODULO_DIGITO_VERIFICADOR: int = 11
-RUT_REGEX: str = r"^(\d{1,8}(?:.\d{3})*)(-([0-9kK]))?$"
+RUT_REGEX: str = r"^(\d{1,3}(?:\.\d{3})*|\d+)(-([0-9kK]))?$"
+BASE_REGEX: str = r"^(?:\d{1,3}(?:\.\d{3})*|\d+)$"
+TAMANO_CACHE_RUTS: int = 4096
+_DIGITOS_VERIFICADORES_VALIDOS: str = "0123456789kK"
+
+# Factor aplicado a cada dígito de la base, leída de derecha a izquierda. La
+# base tiene a lo más 8 dígitos, así que el ciclo se expande una sola vez y se
+# evita calcular `i % 6` por cada dígito.
+_FACTORES_POR_POSICION: Tuple[int, ...] = tuple(
+    FACTORES_DIGITO_VERIFICADOR[i % len(FACTORES_DIGITO_VERIFICADOR)] for i in range(8)
+)
+
+# Suma ponderada en modo SWAR ("SIMD within a register"): la base, rellenada a
+# 8 dígitos, se codifica en UTF-16 para ubicar cada dígito en un carril de 16
+# bits de un único int. Al multiplicarlo por los factores dispuestos en orden
+# inverso, el carril 7 del producto acumula la suma ponderada completa. Ningún
+# carril supera _SUMA_PARCIAL_MAXIMA < 2**16, así que no hay acarreos entre ellos.
+_BITS_CARRIL_SWAR: int = 16
+_CEROS_SWAR: int = sum(ord("0") << (_BITS_CARRIL_SWAR * i) for i in range(8))
+_FACTORES_SWAR: int = sum(
+    factor << (_BITS_CARRIL_SWAR * (7 - i)) for i, factor in enumerate(_FACTORES_POR_POSICION)
+)
+_DESPLAZAMIENTO_SWAR: int = _BITS_CARRIL_SWAR * 7
+_MASCARA_CARRIL_SWAR: int = (1 << _BITS_CARRIL_SWAR) - 1
+
+# Dígito verificador correspondiente a cada suma parcial posible. Como la suma
+# no puede superar 9 veces la suma de los factores, el módulo 11 y la
+# conversión a texto se resuelven con una tabla.
+_SUMA_PARCIAL_MAXIMA: int = 9 * sum(_FACTORES_POR_POSICION)
+_DIGITO_VERIFICADOR_POR_SUMA: Tuple[str, ...] = tuple(
+    "k" if digito == 10 else str(digito)
+    for digito in (
+        (MODULO_DIGITO_VERIFICADOR - suma % MODULO_DIGITO_VERIFICADOR)
+        % MODULO_DIGITO_VERIFICADOR
+        for suma in range(_SUMA_PARCIAL_MAXIMA + 1)
+    )
+)
 
 
 class RutInvalidoError(Exception):
@@ -15,6 +53,10 @@ class RutInvalidoError(Exception):
 class RutBase:
     """Representa el número base de un RUT chileno."""
 
+    __slots__ = ("rut_original", "base")
+
+    PATRON_BASE = re.compile(BASE_REGEX, re.ASCII)
+
     def __init__(self, base: str):
         self.rut_original: str = base
         self.base: str = self.validar_y_normalizar_base(base)
@@ -32,10 +74,28 @@ class RutBase:
         Raises:
             RutInvalidoError: Si el número base es inválido.
         """
-        if not re.match(r"^\d{1,3}(?:\.\d{3})*$", base) and not base.isdigit():
+        # Una base sin puntos se reconoce sin recurrir a la regex.
+        if not (base.isascii() and base.isdecimal()) and not RutBase.PATRON_BASE.fullmatch(base):
             raise RutInvalidoError(f"El número base '{base}' no es válido.")
 
-        base_normalizada: str = base.replace(".", "").lstrip("0")
+        return self._normalizar_base(base)
+
+    @classmethod
+    def _desde_base_validada(cls, base: str) -> "RutBase":
+        """
+        Crea un RutBase a partir de una base cuyo formato ya fue validado por Rut.
+
+        Evita repetir la validación con PATRON_BASE, pero sí normaliza la base y
+        verifica su largo.
+        """
+        rut_base = cls.__new__(cls)
+        rut_base.rut_original = base
+        rut_base.base = rut_base._normalizar_base(base)
+        return rut_base
+
+    def _normalizar_base(self, base: str) -> str:
+        # Una base compuesta sólo por ceros se normaliza a "0" y no a una cadena vacía.
+        base_normalizada: str = base.replace(".", "").lstrip("0") or "0"
         if len(base_normalizada) > 8:
             raise RutInvalidoError(
                 f"El rut '{self.rut_original}' es inválido ya que contiene más de 8 dígitos."
@@ -50,8 +110,15 @@ class RutBase:
 class RutDigitoVerificador(RutBase):
     """Calcula y representa el dígito verificador de un RUT chileno."""
 
-    def __init__(self, base: str):
-        super().__init__(base)
+    __slots__ = ("digito_verificador",)
+
+    def __init__(self, base: Union[str, RutBase]):
+        if isinstance(base, RutBase):
+            # La base ya fue validada y normalizada; no se vuelve a validar.
+            self.rut_original: str = base.rut_original
+            self.base: str = base.base
+        else:
+            super().__init__(base)
         self.digito_verificador: str = self.calcular_digito_verificador()
 
     def calcular_digito_verificador(self) -> str:
@@ -61,14 +128,13 @@ class RutDigitoVerificador(RutBase):
         Returns:
             str: El dígito verificador del RUT.
         """
-        suma_parcial: int = sum(
-            int(digito) * FACTORES_DIGITO_VERIFICADOR[i % 6]
-            for i, digito in enumerate(reversed(str(self.base)))
+        digitos: int = (
+            int.from_bytes(self.base.rjust(8, "0").encode("utf-16-be"), "big") - _CEROS_SWAR
         )
-        digito_verificador: int = (
-            MODULO_DIGITO_VERIFICADOR - suma_parcial % MODULO_DIGITO_VERIFICADOR
-        ) % MODULO_DIGITO_VERIFICADOR
-        return str(digito_verificador) if digito_verificador < 10 else "k"
+        suma_parcial: int = (
+            digitos * _FACTORES_SWAR >> _DESPLAZAMIENTO_SWAR
+        ) & _MASCARA_CARRIL_SWAR
+        return _DIGITO_VERIFICADOR_POR_SUMA[suma_parcial]
 
     def __str__(self) -> str:
         return self.digito_verificador
@@ -86,31 +152,56 @@ class Rut:
     Métodos:
         formatear: Formatea el RUT según las opciones especificadas.
         formatear_lista_ruts: Formatea una lista de RUTs según las opciones especificadas.
+        iterar_lista_ruts_formateada: Genera por partes el resultado de formatear_lista_ruts.
     """
 
-    PATRON_RUT = re.compile(RUT_REGEX)
+    __slots__ = ("rut_string", "base_string", "base", "digito_verificador", "_rut_canonico")
+
+    PATRON_RUT = re.compile(RUT_REGEX, re.ASCII)
 
     def __init__(self, rut: str):
         self.rut_string: str = str(rut).strip()
-        self._validar_formato_rut()
-        self._validar_digito_verificador()
-        self.base = RutBase(self.base_string)
-        self.digito_verificador = RutDigitoVerificador(self.base_string)
+        digito_verificador_input = self._validar_formato_rut()
+        # El formato de la base ya fue validado junto con el del RUT completo.
+        self.base = RutBase._desde_base_validada(  # pylint: disable=protected-access
+            self.base_string
+        )
+        self.digito_verificador = RutDigitoVerificador(self.base)
+        self._validar_digito_verificador(digito_verificador_input)
+        # Un Rut no cambia tras su creación, así que su forma canónica se arma una sola vez.
+        self._rut_canonico: str = (
+            f"{self.base.base}-{self.digito_verificador.digito_verificador}"
+        )
+
+    def _validar_formato_rut(self) -> Optional[str]:
+        # Un RUT compuesto sólo por dígitos (p. ej. un int) no tiene puntos ni
+        # dígito verificador, por lo que no es necesario pasar por la regex.
+        rut_string = self.rut_string
+        if rut_string.isascii() and rut_string.isdecimal():
+            self.base_string: str = rut_string
+            return None
+
+        # La forma canónica `NNNNNNNN-D`, sin puntos, también se reconoce sin regex.
+        base_string = rut_string[:-2]
+        if (
+            rut_string[-2:-1] == "-"
+            and rut_string[-1] in _DIGITOS_VERIFICADORES_VALIDOS
+            and base_string.isascii()
+            and base_string.isdecimal()
+        ):
+            self.base_string = base_string
+            return rut_string[-1].lower()
 
-    def _validar_formato_rut(self) -> None:
         match = Rut.PATRON_RUT.fullmatch(self.rut_string)
         if not match:
             raise RutInvalidoError(
                 f"El formato del RUT '{self.rut_string}' es inválido."
             )
-        self.base_string: str = match.group(1)
+        self.base_string = match.group(1)
+        return match.group(3).lower() if match.group(3) else None
 
-    def _validar_digito_verificador(self) -> None:
-        match = Rut.PATRON_RUT.fullmatch(self.rut_string)
-        digito_verificador_input = match.group(3).lower() if match.group(3) else None
-        digito_verificador_calculado = RutDigitoVerificador(
-            self.base_string
-        ).digito_verificador
+    def _validar_digito_verificador(self, digito_verificador_input: Optional[str]) -> None:
+        digito_verificador_calculado = self.digito_verificador.digito_verificador
 
         if (
             digito_verificador_input
@@ -122,7 +213,7 @@ class Rut:
             )
 
     def __str__(self) -> str:
-        return f"{self.base}-{self.digito_verificador}"
+        return self._rut_canonico
 
     def formatear(self, separador_miles: bool = False, mayusculas: bool = False) -> str:
         """
@@ -135,56 +226,82 @@ class Rut:
         Returns:
             str: El RUT formateado.
         """
-        rut = str(self)
-        if separador_miles:
-            rut = (
-                self._agregar_separador_miles(rut.split("-", maxsplit=1)[0])
-                + "-"
-                + rut.split("-")[1]
-            )
+        if not separador_miles and not mayusculas:
+            return self._rut_canonico
 
-        if mayusculas:
-            rut = rut.upper()
+        base = self.base.base
+        if separador_miles:
+            base = self._agregar_separador_miles(base)
+        rut = f"{base}-{self.digito_verificador.digito_verificador}"
 
-        return rut
+        return rut.upper() if mayusculas else rut
 
     @staticmethod
     def _agregar_separador_miles(numero: str) -> str:
-        return f"{int(numero):,}".replace(",", ".")
+        # La base normalizada tiene a lo más 8 dígitos, por lo que basta con
+        # insertar hasta dos puntos mediante slicing, sin pasar por int().
+        largo = len(numero)
+        if largo <= 3:
+            return numero
+        if largo <= 6:
+            return f"{numero[:-3]}.{numero[-3:]}"
+        return f"{numero[:-6]}.{numero[-6:-3]}.{numero[-3:]}"
 
     @staticmethod
-    def _validar_lista_ruts(ruts: List[str]) -> Dict[str, List[Union[str, Tuple[str, str]]]]:
-        validos: List[str] = []
-        invalidos: List[Tuple[str, str]] = []
+    def _validar_lista_ruts(
+        ruts: Iterable[str],
+        separador_miles: bool,
+        mayusculas: bool,
+        invalidos: List[Tuple[str, str]],
+    ) -> Iterator[str]:
+        # Genera cada RUT válido ya formateado apenas se valida, de modo que no se
+        # conserva el Rut completo. Los inválidos se acumulan en `invalidos`, ya
+        # que su sección va al final del resultado.
+        agregar_invalido = invalidos.append
+        validar = _validar_rut_cacheado
         for rut in ruts:
-            try:
-                rut_valido: str = str(Rut(rut))
-                validos.append(rut_valido)
-            except RutInvalidoError as e:
-                invalidos.append((rut, str(e)))
-        return {"validos": validos, "invalidos": invalidos}
+            # Rut ignora los espacios externos, así que la clave de la caché se
+            # normaliza para que " 1-9" y "1-9" compartan una misma entrada.
+            rut_valido, error = validar((rut if isinstance(rut, str) else str(rut)).strip())
+            if rut_valido is None:
+                agregar_invalido((rut, error))
+            else:
+                yield rut_valido.formatear(separador_miles, mayusculas)
+
+    @staticmethod
+    def _formatear_texto(ruts_formateados: Iterable[str]) -> Iterator[str]:
+        separador: str = ""
+        for rut in ruts_formateados:
+            yield f"{separador}{rut}"
+            separador = "\n"
 
     @staticmethod
-    def _formatear_csv(ruts_formateados: List[str]) -> str:
-        cadena_ruts: str = "\n".join(ruts_formateados)
-        return f"rut\n{cadena_ruts}"
+    def _formatear_csv(ruts_formateados: Iterable[str]) -> Iterator[str]:
+        yield "rut"
+        for rut in ruts_formateados:
+            yield f"\n{rut}"
 
     @staticmethod
-    def _formatear_xml(ruts_formateados: List[str]) -> str:
-        xml_lines: List[str] = ["<root>"]
+    def _formatear_xml(ruts_formateados: Iterable[str]) -> Iterator[str]:
+        yield "<root>"
         for rut in ruts_formateados:
-            xml_lines.append(f"    <rut>{rut}</rut>")
-        xml_lines.append("</root>")
-        return "\n".join(xml_lines)
+            yield f"\n    <rut>{rut}</rut>"
+        yield "\n</root>"
 
     @staticmethod
-    def _formatear_json(ruts_formateados: List[str]) -> str:
-        ruts_json: List[Dict[str, str]] = [{"rut": rut} for rut in ruts_formateados]
-        return str(ruts_json)
+    def _formatear_json(ruts_formateados: Iterable[str]) -> Iterator[str]:
+        # Un RUT formateado sólo contiene dígitos, puntos, guión y 'k', por lo
+        # que no requiere escape y el JSON se arma sin crear un dict por RUT.
+        yield "["
+        separador: str = ""
+        for rut in ruts_formateados:
+            yield f'{separador}{{"rut": "{rut}"}}'
+            separador = ", "
+        yield "]"
 
     @staticmethod
     def formatear_lista_ruts(
-        ruts: List[str],
+        ruts: Iterable[str],
         separador_miles: bool = False,
         mayusculas: bool = False,
         formato=None,
@@ -193,7 +310,8 @@ class Rut:
         Formatea una lista de RUTs según las opciones especificadas.
 
         Args:
-            ruts (List[str]): Una lista de RUTs en formato string o numérico.
+            ruts (Iterable[str]): Una lista, tupla o cualquier iterable de RUTs en formato
+                string o numérico. Se recorre una sola vez.
             separador_miles (bool, opcional): Si se deben agregar separadores de miles (puntos).
             mayusculas (bool, opcional): Si los RUTs deben estar en mayúsculas.
             formato (str, opcional): El formato de salida deseado (csv, json, xml, None).
@@ -202,30 +320,79 @@ class Rut:
             str: Una cadena con los RUTs válidos e inválidos formateados según las opciones
                 especificadas.
         """
-        formato_salida: Dict[str, callable] = {
+        return "".join(
+            Rut.iterar_lista_ruts_formateada(ruts, separador_miles, mayusculas, formato)
+        )
+
+    @staticmethod
+    def iterar_lista_ruts_formateada(
+        ruts: Iterable[str],
+        separador_miles: bool = False,
+        mayusculas: bool = False,
+        formato=None,
+    ) -> Iterator[str]:
+        """
+        Genera por partes el mismo resultado que formatear_lista_ruts.
+
+        Permite escribir listas grandes de RUTs en un archivo o socket sin armar
+        antes una única cadena con todo el resultado. Los RUTs válidos se generan a
+        medida que se validan; sólo los inválidos se retienen hasta el final, pues
+        su sección va después de la de los válidos.
+
+        Args:
+            ruts (Iterable[str]): Una lista, tupla o cualquier iterable de RUTs en formato
+                string o numérico. Se recorre una sola vez.
+            separador_miles (bool, opcional): Si se deben agregar separadores de miles (puntos).
+            mayusculas (bool, opcional): Si los RUTs deben estar en mayúsculas.
+            formato (str, opcional): El formato de salida deseado (csv, json, xml, None).
+
+        Yields:
+            str: Fragmentos consecutivos del resultado; concatenados equivalen a
+                formatear_lista_ruts con los mismos argumentos.
+        """
+        formato_salida: Dict[str, Callable[[Iterable[str]], Iterator[str]]] = {
             "csv": Rut._formatear_csv,
             "xml": Rut._formatear_xml,
             "json": Rut._formatear_json,
         }
-        ruts_validos_invalidos: Dict[str, List[str]] = Rut._validar_lista_ruts(ruts)
-        ruts_validos: List[str] = ruts_validos_invalidos["validos"]
-        ruts_invalidos: List[Tuple[str, str]] = ruts_validos_invalidos["invalidos"]
-
-        resultado: str = ""
-        if ruts_validos:
-            ruts_validos_formateados: List[str] = [
-                Rut(rut).formatear(separador_miles, mayusculas) for rut in ruts_validos
-            ]
-            resultado += "RUTs válidos:\n"
+        ruts_invalidos: List[Tuple[str, str]] = []
+        ruts_validos_formateados: Iterator[str] = Rut._validar_lista_ruts(
+            ruts, separador_miles, mayusculas, ruts_invalidos
+        )
+        # La entrada se consume a medida que se generan los fragmentos; el
+        # encabezado se emite recién cuando aparece el primer RUT válido.
+        primer_rut_valido: Optional[str] = next(ruts_validos_formateados, None)
+
+        if primer_rut_valido is not None:
+            ruts_validos_formateados = chain((primer_rut_valido,), ruts_validos_formateados)
+            yield "RUTs válidos:\n"
             if formato in ("csv", "xml", "json"):
-                resultado += formato_salida[formato](ruts_validos_formateados)
+                yield from formato_salida[formato](ruts_validos_formateados)
             else:
-                resultado += "\n".join(ruts_validos_formateados)
-            resultado += "\n\n"
+                yield from Rut._formatear_texto(ruts_validos_formateados)
+            yield "\n\n"
 
         if ruts_invalidos:
-            resultado += "RUTs inválidos:\n"
+            yield "RUTs inválidos:\n"
             for rut, error in ruts_invalidos:
-                resultado += f"{rut} - {error}\n"
+                yield f"{rut} - {error}\n"
 
-        return resultado
+
+@lru_cache(maxsize=TAMANO_CACHE_RUTS)
+def _validar_rut_cacheado(cadena_rut: str) -> Tuple[Optional[Rut], Optional[str]]:
+    """
+    Valida un RUT recordando el resultado, válido o no, para entradas repetidas.
+
+    Se guarda el mensaje de error en lugar de la excepción para no retener su traceback.
+
+    Args:
+        cadena_rut (str): El RUT en formato string.
+
+    Returns:
+        Tuple[Optional[Rut], Optional[str]]: El Rut y None si es válido, o None y el
+            mensaje de error si es inválido.
+    """
+    try:
+        return Rut(cadena_rut), None
+    except RutInvalidoError as e:
+        return None, str(e)
@@ -1,7 +1,13 @@
 # pylint: disable=missing-module-docstring
 
 import pytest
-from rutificador.main import Rut, RutDigitoVerificador, RutBase, RutInvalidoError
+from rutificador.main import (
+    Rut,
+    RutDigitoVerificador,
+    RutBase,
+    RutInvalidoError,
+    _validar_rut_cacheado,
+)
 
 # Datos de prueba para RutDigitoVerificador
 cadenas_test_digito_verificador = [
@@ -29,6 +35,8 @@ cadenas_base_validas = [
     ("123.456", "123456"),
     ("1.234.567", "1234567"),
     ("12.345.678", "12345678"),
+    ("0", "0"),
+    ("000.000", "0"),
 ]
 
 cadenas_base_invalidas = [
@@ -39,6 +47,9 @@ cadenas_base_invalidas = [
     "",  # RUT base vacío
     " ",  # RUT base sin dígitos
     "-1",  # RUT base negativo o dígito verificador sin base
+    "12\u00b3",  # Caracteres numéricos que no son dígitos decimales
+    "123\n",  # Salto de línea al final
+    "\u0661\u0662\u0663",  # Dígitos decimales no ASCII
 ]
 
 # Datos de prueba para Rut
@@ -52,7 +63,15 @@ cadenas_rut_validas = [
     " 00.000.001",  # Con ceros delante, puntos y espacios
     " 25.005.183-2 "  # Con puntos, espacios y D.V.
 ]
-cadenas_rut_invalidas = ["12345678-9", "98765432-1", "12345.67", "123456789"]
+cadenas_rut_invalidas = [
+    "12345678-9",
+    "98765432-1",
+    "12345.67",
+    "123456789",
+    "\u0661\u0662\u0663",  # Dígitos decimales no ASCII
+    "12x345x678-5",  # Separador de miles distinto de punto
+    "1.2345678-5",  # Punto mal ubicado
+]
 
 # Datos de prueba para formatear_lista_ruts
 datos_test_formato = [
@@ -64,11 +83,20 @@ datos_test_formato = [
     ),
     (
         "json",
-        "RUTs válidos:\n[{'rut': '12345678-5'}, {'rut': '98765432-5'}, "
-        "{'rut': '1-9'}]\n\n"
+        'RUTs válidos:\n[{"rut": "12345678-5"}, {"rut": "98765432-5"}, '
+        '{"rut": "1-9"}]\n\n'
     ),
 ]
 
+datos_test_separador_miles = [
+    ("1-9", "1-9"),
+    ("999-7", "999-7"),
+    ("1234-3", "1.234-3"),
+    ("123456-0", "123.456-0"),
+    ("1234567-4", "1.234.567-4"),
+    ("12345678-5", "12.345.678-5"),
+]
+
 datos_test_formatear_lista_ruts = [
     (
         ["12345678-5", "98765432-5", "1-9"],
@@ -105,6 +133,15 @@ class TestsRutDigitoVerificador:
             rut = RutDigitoVerificador(base)
             assert str(rut) == esperado
 
+    def test_digito_verificador_desde_rut_base(self):
+        """
+        Prueba que el dígito verificador se calcule a partir de un RutBase ya validado.
+        """
+        rut = RutDigitoVerificador(RutBase("12.345.678"))
+        assert rut.base == "12345678"
+        assert rut.rut_original == "12.345.678"
+        assert str(rut) == "5"
+
 
 class TestsRutBase:
     """
@@ -147,6 +184,12 @@ class TestsRut:
         rut = Rut(cadena_rut)
         assert rut.rut_string == cadena_rut.strip()
 
+    def test_rut_numerico(self):
+        """
+        Prueba que un RUT entregado como número entero se valide y calcule su dígito verificador.
+        """
+        assert str(Rut(12345678)) == "12345678-5"
+
     @pytest.mark.parametrize("cadena_rut", cadenas_rut_invalidas)
     def test_cadenas_rut_invalidas(self, cadena_rut):
         """
@@ -173,6 +216,52 @@ class TestsRut:
         resultado = Rut.formatear_lista_ruts(ruts, formato=formato)
         assert resultado == esperado
 
+    @pytest.mark.parametrize("formato", [None, "csv", "xml", "json"])
+    def test_iterar_lista_ruts_formateada(self, formato):
+        """
+        Prueba que iterar_lista_ruts_formateada consuma la entrada a medida que genera
+        el resultado por partes.
+        """
+        ruts = ["98765432-1", "12345678-5", "123456789", "1-9"]
+        consumidos = []
+
+        def generar_ruts():
+            for rut in ruts:
+                consumidos.append(rut)
+                yield rut
+
+        partes = Rut.iterar_lista_ruts_formateada(generar_ruts(), formato=formato)
+        assert next(partes) == "RUTs válidos:\n"
+        assert consumidos == ruts[:2]
+        resto = list(partes)
+        assert consumidos == ruts
+        assert len(resto) > 3
+        assert resto[-3:] == [
+            "RUTs inválidos:\n",
+            "98765432-1 - El dígito verificador '1' no coincide con "
+            "el dígito verificador calculado '5'.\n",
+            "123456789 - El rut '123456789' es inválido ya que contiene "
+            "más de 8 dígitos.\n",
+        ]
+
+    def test_formatear_lista_ruts_desde_generador(self):
+        """
+        Prueba que formatear_lista_ruts acepte cualquier iterable, no sólo listas.
+        """
+        ruts, formato, esperado = datos_test_formatear_lista_ruts[1]
+        resultado = Rut.formatear_lista_ruts((rut for rut in ruts), formato=formato)
+        assert resultado == esperado
+
+    def test_formatear_lista_ruts_repetidos_usa_cache(self):
+        """
+        Prueba que los RUTs repetidos, válidos e inválidos, se resuelvan desde la caché.
+        """
+        ruts, _, esperado = datos_test_formatear_lista_ruts[1]
+        Rut.formatear_lista_ruts(ruts)
+        aciertos = _validar_rut_cacheado.cache_info().hits
+        assert Rut.formatear_lista_ruts(ruts) == esperado
+        assert _validar_rut_cacheado.cache_info().hits >= aciertos + len(ruts)
+
     # pylint: disable=C0301
     def test_formatear_rut_con_separador_miles(self, rut_valido):
         """
@@ -181,6 +270,13 @@ class TestsRut:
         rut_formateado = rut_valido.formatear(separador_miles=True)
         assert rut_formateado == "12.345.678-5"
 
+    @pytest.mark.parametrize("cadena_rut, esperado", datos_test_separador_miles)
+    def test_formatear_separador_miles_por_largo(self, cadena_rut, esperado):
+        """
+        Prueba que el separador de miles se agregue correctamente para bases de 1 a 8 dígitos.
+        """
+        assert Rut(cadena_rut).formatear(separador_miles=True) == esperado
+
     def test_formatear_rut_con_mayusculas(self, rut_valido):
         """
         Prueba que el método formatear formatee correctamente una cadena RUT con mayusculas=False.
@@ -195,3 +291,11 @@ class TestsRut:
         """
         rut_formateado = rut_valido.formatear(separador_miles=True, mayusculas=True)
         assert rut_formateado == "12.345.678-5"
+
+    def test_rut_sin_dict_por_instancia(self, rut_valido):
+        """
+        Prueba que Rut y sus componentes usen __slots__ en lugar de un __dict__ por instancia.
+        """
+        assert not hasattr(rut_valido, "__dict__")
+        assert not hasattr(rut_valido.base, "__dict__")
+        assert not hasattr(rut_valido.digito_verificador, "__dict__")